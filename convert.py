@@ -11,17 +11,23 @@ Usage:
 import argparse
 import sys
 from pathlib import Path
-from colorama import init, Fore, Style
 
-# Initialize colorama for Windows
-init()
+if sys.stdout.isatty():
+    from colorama import init, Fore, Style
+    # Initialize colorama for Windows
+    init()
+else:
+    # Output is redirected (all of it is printed to stdout), so every
+    # Fore/Style attribute resolves to an empty string
+    class _NoColor:
+        def __getattr__(self, name):
+            return ""
+    
+    Fore = Style = _NoColor()
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core import VoiceConverter
-from src.utils import load_audio, save_audio
-
 
 def print_header():
     """Print application header."""
@@ -147,7 +153,9 @@ def main():
                 model_path = models[0]
                 print(f"{Fore.CYAN}Using model: {model_path.name}{Style.RESET_ALL}")
     
-    # Initialize converter
+    # Initialize converter (imported here so --help/--list-models skip torch)
+    from src.core import VoiceConverter
+    
     print(f"{Fore.CYAN}Initializing voice converter...{Style.RESET_ALL}")
     converter = VoiceConverter(model_path=model_path)
     
@@ -164,7 +172,8 @@ def main():
             speaker_id=args.speaker_id,
             pitch_shift=args.pitch_shift,
             f0_method=args.f0_method,
-            index_rate=args.index_rate
+            index_rate=args.index_rate,
+            verbose=False  # settings are already printed above
         )
         
         print(f"\n{Fore.GREEN}✓ Conversion complete!{Style.RESET_ALL}")
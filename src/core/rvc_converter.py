@@ -5,15 +5,10 @@ This module provides a simple interface for voice conversion using RVC models.
 For training, we use the Applio or RVC WebUI which handles the complex setup.
 """
 
-import os
-import sys
 import torch
-import numpy as np
 from pathlib import Path
-from typing import Optional, Union, Tuple
+from typing import Optional
 import logging
-import subprocess
-import json
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -48,10 +43,10 @@ class RVCConverter:
         else:
             self.device = device
         
-        logger.info(f"🎤 RVC Converter initialized")
-        logger.info(f"   Device: {self.device}")
+        logger.info("🎤 RVC Converter initialized")
+        logger.info("   Device: %s", self.device)
         if torch.cuda.is_available():
-            logger.info(f"   GPU: {torch.cuda.get_device_name(0)}")
+            logger.info("   GPU: %s", torch.cuda.get_device_name(0))
         
         self.model_path = model_path
         self.index_path = index_path
@@ -80,9 +75,9 @@ class RVCConverter:
             index_path = Path(index_path)
             if index_path.exists():
                 self.index_path = str(index_path)
-                logger.info(f"📁 Index file: {index_path.name}")
+                logger.info("📁 Index file: %s", index_path.name)
         
-        logger.info(f"✓ Model loaded: {model_path.name}")
+        logger.info("✓ Model loaded: %s", model_path.name)
         return True
     
     def convert_with_applio(
@@ -124,10 +119,10 @@ class RVCConverter:
         # Ensure output directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"🎵 Converting: {Path(input_audio).name}")
-        logger.info(f"   Pitch shift: {pitch_shift:+d} semitones")
-        logger.info(f"   F0 method: {f0_method}")
-        logger.info(f"   Index rate: {index_rate}")
+        logger.info("🎵 Converting: %s", Path(input_audio).name)
+        logger.info("   Pitch shift: %+d semitones", pitch_shift)
+        logger.info("   F0 method: %s", f0_method)
+        logger.info("   Index rate: %s", index_rate)
         
         # For now, return guidance on using Applio
         logger.warning("""
@@ -13,9 +13,8 @@ from pathlib import Path
 from typing import Optional, Union
 import logging
 import os
-import sys
 
-from ..utils.audio import load_audio, save_audio
+from ..utils.audio import load_audio, save_audio, get_audio_info
 
 # Import so-vits-svc components
 try:
@@ -28,6 +27,9 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Audio file extensions accepted as training samples
+SAMPLE_EXTENSIONS = frozenset({".wav", ".mp3"})
+
 
 class VoiceConverter:
     """
@@ -62,7 +64,7 @@ class VoiceConverter:
         else:
             self.device = device
             
-        logger.info(f"Using device: {self.device}")
+        logger.info("Using device: %s", self.device)
         
         self.model_path = Path(model_path) if model_path else None
         self.config_path = Path(config_path) if config_path else None
@@ -90,7 +92,7 @@ class VoiceConverter:
         if not model_path.exists():
             raise FileNotFoundError(f"Model not found: {model_path}")
         
-        logger.info(f"Loading model from {model_path}")
+        logger.info("Loading model from %s", model_path)
         
         self.model_path = model_path
         
@@ -103,7 +105,7 @@ class VoiceConverter:
         
         if config_path and Path(config_path).exists():
             self.config_path = Path(config_path)
-            logger.info(f"Using config: {self.config_path}")
+            logger.info("Using config: %s", self.config_path)
         else:
             logger.warning("Config file not found, will use defaults")
         
@@ -117,7 +119,8 @@ class VoiceConverter:
         pitch_shift: int = 0,
         f0_method: str = "crepe",
         index_rate: float = 0.5,
-        protect: float = 0.33
+        protect: float = 0.33,
+        verbose: bool = True
     ) -> np.ndarray:
         """
         Convert source audio to target voice.
@@ -130,6 +133,7 @@ class VoiceConverter:
             f0_method: F0 extraction method ('crepe', 'parselmouth', 'dio', 'harvest')
             index_rate: Feature retrieval index rate (0-1)
             protect: Protection threshold for original voice (0-1)
+            verbose: Log conversion settings (disable for batch runs)
             
         Returns:
             Converted audio as numpy array
@@ -137,19 +141,30 @@ class VoiceConverter:
         if not self.model_path:
             raise ValueError("No model loaded. Call load_model() first.")
         
-        # Load audio if path provided
+        # so-vits-svc reads input files itself, so they are not decoded here
         if isinstance(source_audio, (str, Path)):
-            audio, sr = load_audio(source_audio, sr=self.sample_rate)
             input_path = Path(source_audio)
+            if not input_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {input_path}")
+            audio = None
         else:
             audio = source_audio
-            sr = self.sample_rate
             input_path = None
         
-        logger.info(f"Converting audio: {len(audio)/sr:.2f}s")
-        logger.info(f"  Pitch shift: {pitch_shift} semitones")
-        logger.info(f"  F0 method: {f0_method}")
-        logger.info(f"  Index rate: {index_rate}")
+        if verbose:
+            if audio is not None:
+                logger.info("Converting audio: %.2fs", len(audio) / self.sample_rate)
+            else:
+                try:
+                    duration = get_audio_info(input_path)["duration"]
+                except RuntimeError:
+                    # libsndfile can't parse this format; so-vits-svc may still decode it
+                    logger.info("Converting audio: %s (duration unknown)", input_path.name)
+                else:
+                    logger.info("Converting audio: %.2fs", duration)
+            logger.info("  Pitch shift: %s semitones", pitch_shift)
+            logger.info("  F0 method: %s", f0_method)
+            logger.info("  Index rate: %s", index_rate)
         
         # Use so-vits-svc inference
         try:
@@ -167,14 +182,17 @@ class VoiceConverter:
                 # protection_seconds parameter to control voice protection
             )
         except Exception as e:
-            logger.error(f"Conversion failed: {e}")
+            logger.error("Conversion failed: %s", e)
             # Fallback: return input audio
+            if audio is None:
+                audio, _ = load_audio(input_path, sr=self.sample_rate)
             converted_audio = audio
         
         # Save if output path provided
         if output_path:
             save_audio(converted_audio, output_path, sr=self.sample_rate)
-            logger.info(f"Saved to: {output_path}")
+            if verbose:
+                logger.info("Saved to: %s", output_path)
         
         return converted_audio
     
@@ -208,15 +226,19 @@ class VoiceConverter:
         if not samples_dir.exists():
             raise FileNotFoundError(f"Samples directory not found: {samples_dir}")
         
-        # Find WAV files
-        wav_files = list(samples_dir.glob("*.wav")) + list(samples_dir.glob("*.mp3"))
+        # Find audio files in a single directory pass
+        with os.scandir(samples_dir) as it:
+            wav_files = [
+                Path(entry.path) for entry in it
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SAMPLE_EXTENSIONS
+            ]
         if not wav_files:
             raise ValueError(f"No audio files found in {samples_dir}")
         
-        logger.info(f"Training voice model from {len(wav_files)} samples in {samples_dir}")
-        logger.info(f"  Epochs: {epochs}")
-        logger.info(f"  Batch size: {batch_size}")
-        logger.info(f"  Learning rate: {learning_rate}")
+        logger.info("Training voice model from %d samples in %s", len(wav_files), samples_dir)
+        logger.info("  Epochs: %s", epochs)
+        logger.info("  Batch size: %s", batch_size)
+        logger.info("  Learning rate: %s", learning_rate)
         
         # Note: Full training requires preprocessing and model architecture setup
         # For now, provide guidance on using the so-vits-svc CLI
@@ -3,10 +3,39 @@ Audio utility functions for loading, saving, and processing audio files.
 """
 
 import numpy as np
-import librosa
 import soundfile as sf
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Dict, Tuple, Optional
+
+if TYPE_CHECKING:
+    import torchaudio
+
+# Resample kernels keyed by (orig_sr, target_sr), built once per rate pair.
+# A filter width of 16 zero crossings gives a sharper anti-aliasing filter
+# than torchaudio's default of 6, though still not as clean as librosa's
+# soxr_hq; that trade-off is accepted for speed on voice input.
+_RESAMPLE_FILTER_WIDTH = 16
+_RESAMPLERS: Dict[Tuple[int, int], "torchaudio.transforms.Resample"] = {}
+
+# Frames per block when streaming audio to disk
+_WRITE_BLOCK_SIZE = 1 << 16
+
+
+def _get_resampler(orig_sr: int, target_sr: int) -> "torchaudio.transforms.Resample":
+    """
+    Return a cached torchaudio resampler for the given rate pair.
+    
+    torchaudio's polyphase resampler is much faster than librosa's. It is
+    imported here rather than at module load because it pulls in all of
+    torch; raises ImportError if torchaudio is not installed.
+    """
+    key = (orig_sr, target_sr)
+    if key not in _RESAMPLERS:
+        import torchaudio
+        _RESAMPLERS[key] = torchaudio.transforms.Resample(
+            orig_sr, target_sr, lowpass_filter_width=_RESAMPLE_FILTER_WIDTH
+        )
+    return _RESAMPLERS[key]
 
 
 def load_audio(
@@ -30,7 +59,38 @@ def load_audio(
     if not file_path.exists():
         raise FileNotFoundError(f"Audio file not found: {file_path}")
     
-    # Load audio
+    try:
+        # soundfile decodes WAV/FLAC/OGG (and MP3 with libsndfile >= 1.1)
+        # directly, without going through audioread
+        audio, orig_sr = sf.read(str(file_path), dtype="float32", always_2d=False)
+    except RuntimeError:
+        # Format not supported by libsndfile, fall through to torchaudio/librosa
+        pass
+    else:
+        # soundfile returns (samples,) for mono files, (samples, channels) otherwise
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1) if mono else np.ascontiguousarray(audio.T)
+        return resample_audio(audio, orig_sr, sr), sr
+    
+    try:
+        # Imported lazily, torchaudio pulls in all of torch
+        import torchaudio
+        wav, orig_sr = torchaudio.load(str(file_path))
+    except (RuntimeError, ImportError, OSError):
+        # torchaudio missing, broken or unable to decode (e.g. no ffmpeg/torchcodec
+        # backend), fall through to librosa/audioread
+        pass
+    else:
+        # torchaudio returns (channels, samples); drop the axis for mono files
+        # so the shape matches the soundfile and librosa paths
+        if mono or wav.shape[0] == 1:
+            wav = wav.mean(dim=0)
+        if orig_sr != sr:
+            wav = _get_resampler(orig_sr, sr)(wav)
+        return wav.numpy(), sr
+    
+    # Fallback: load audio with librosa (imported lazily, it is slow to import)
+    import librosa
     audio, orig_sr = librosa.load(str(file_path), sr=sr, mono=mono)
     
     return audio, sr
@@ -55,11 +115,18 @@ def save_audio(
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Normalize to prevent clipping
-    if np.abs(audio).max() > 1.0:
-        audio = audio / np.abs(audio).max() * 0.95
+    # Normalize to prevent clipping; the gain is applied per block as it is
+    # written so no normalized copy of the whole signal is allocated
+    peak = max(float(audio.max()), -float(audio.min()))
+    gain = 0.95 / peak if peak > 1.0 else None
     
-    sf.write(str(file_path), audio, sr)
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    with sf.SoundFile(str(file_path), "w", samplerate=sr, channels=channels) as f:
+        for start in range(0, len(audio), _WRITE_BLOCK_SIZE):
+            block = audio[start:start + _WRITE_BLOCK_SIZE]
+            if gain is not None:
+                block = block * gain
+            f.write(block)
     
     return file_path
 
@@ -78,11 +145,29 @@ def resample_audio(
         target_sr: Target sample rate
         
     Returns:
-        Resampled audio array
+        Resampled audio array (same dtype as the input)
     """
     if orig_sr == target_sr:
         return audio
     
+    try:
+        import torch
+        resampler = _get_resampler(orig_sr, target_sr)
+    except (ImportError, OSError, RuntimeError):
+        # torch/torchaudio missing or broken (e.g. a DLL that fails to load)
+        pass
+    else:
+        # Reuse the same cached kernels as load_audio; they run in float32,
+        # so cast back to the caller's dtype afterwards. torch.from_numpy
+        # rejects negative strides, so make a contiguous copy when needed.
+        wav = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
+        resampled = resampler(wav).numpy()
+        if np.issubdtype(audio.dtype, np.floating):
+            resampled = resampled.astype(audio.dtype, copy=False)
+        return resampled
+    
+    # Fallback when torchaudio is unavailable
+    import librosa
     return librosa.resample(audio, orig_sr=orig_sr, target_sr=target_sr)
 
 
@@ -6,18 +6,35 @@ This script uses so-vits-svc-fork to train a model that can convert other voices
 
 Usage:
     python train.py
+    python train.py --no-cache
 """
 
+import argparse
 import os
 import sys
 import logging
-import shutil
 import json
 from pathlib import Path
-from colorama import init, Fore, Style
 
-# Initialize colorama
-init()
+# orjson is optional; fall back to the stdlib json module
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# The header is printed to stdout but everything else goes through logging,
+# which writes to stderr; only colour when both are attached to a terminal
+if sys.stdout.isatty() and sys.stderr.isatty():
+    from colorama import init, Fore, Style
+    # Initialize colorama
+    init()
+else:
+    class _NoColor:
+        def __getattr__(self, name):
+            return ""
+    
+    Fore = Style = _NoColor()
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +42,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Deliberate copy of src.core.voice_converter.SAMPLE_EXTENSIONS: importing
+# it from there would load torch just to list samples. Keep the two in sync.
+SAMPLE_EXTENSIONS = frozenset({".wav", ".mp3"})
+
+# Cached samples/ listing, invalidated when the directory's mtime changes
+SAMPLES_INDEX = Path(".cache/samples_index.json")
+
 
 def print_header():
     """Print training header."""
@@ -34,8 +58,62 @@ def print_header():
     print(f"╚══════════════════════════════════════════╝{Style.RESET_ALL}\n")
 
 
-def check_samples():
-    """Check if voice samples exist."""
+def _read_samples_index(samples_dir, mtime_ns):
+    """Return the cached file names for samples_dir, or None if the index is missing, stale or malformed."""
+    try:
+        index = json.loads(SAMPLES_INDEX.read_text())
+    except (OSError, ValueError):
+        return None
+    
+    if (
+        not isinstance(index, dict)
+        or index.get("samples_dir") != str(samples_dir)
+        or index.get("mtime_ns") != mtime_ns
+    ):
+        return None
+    
+    names = index.get("files")
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        return None
+    return names
+
+
+def scan_samples(samples_dir, use_cache=True):
+    """List (name, size) pairs for audio files in samples_dir, using the cached index if fresh."""
+    mtime_ns = os.stat(samples_dir).st_mtime_ns
+    
+    names = _read_samples_index(samples_dir, mtime_ns) if use_cache else None
+    if names is not None:
+        # Only names are cached: overwriting a file in place leaves the
+        # directory's mtime alone, so sizes are always read fresh
+        try:
+            return [(name, os.stat(os.path.join(samples_dir, name)).st_size) for name in names]
+        except OSError:
+            pass  # A listed file is gone; rescan
+    
+    # One directory pass instead of a glob per extension
+    with os.scandir(samples_dir) as it:
+        audio_files = sorted(
+            (e.name, e.stat().st_size) for e in it
+            if e.is_file() and os.path.splitext(e.name)[1].lower() in SAMPLE_EXTENSIONS
+        )
+    
+    # The index is only a shortcut; a read-only checkout just rescans each run
+    try:
+        SAMPLES_INDEX.parent.mkdir(exist_ok=True)
+        SAMPLES_INDEX.write_text(json.dumps({
+            "samples_dir": str(samples_dir),
+            "mtime_ns": mtime_ns,
+            "files": [name for name, _ in audio_files],
+        }))
+    except OSError:
+        pass
+    
+    return audio_files
+
+
+def check_samples(use_cache=True):
+    """Check if voice samples exist and return them as (name, size) pairs."""
     samples_dir = Path("samples")
     
     if not samples_dir.exists():
@@ -43,29 +121,32 @@ def check_samples():
         logger.info("Create a 'samples/' folder and add your voice recordings (.wav files)")
         return []
     
-    audio_files = list(samples_dir.glob("*.wav")) + list(samples_dir.glob("*.mp3"))
+    audio_files = scan_samples(samples_dir, use_cache=use_cache)
     
     if not audio_files:
         logger.error(f"{Fore.RED}No audio files found in samples/{Style.RESET_ALL}")
         logger.info("Add your voice recordings (.wav or .mp3) to the samples/ folder")
         return []
     
-    logger.info(f"{Fore.GREEN}Found {len(audio_files)} audio files:{Style.RESET_ALL}")
+    # Build the listing and emit it as one log record
+    lines = [f"{Fore.GREEN}Found {len(audio_files)} audio files:{Style.RESET_ALL}"]
     
     total_mb = 0
-    for f in audio_files:
-        size_mb = f.stat().st_size / (1024 * 1024)
+    for name, size in audio_files:
+        size_mb = size / (1024 * 1024)
         total_mb += size_mb
-        logger.info(f"  - {f.name} ({size_mb:.1f}MB)")
+        lines.append(f"  - {name} ({size_mb:.1f}MB)")
     
-    logger.info(f"\n  Total: {total_mb:.1f}MB")
+    lines.append(f"\n  Total: {total_mb:.1f}MB")
     
     # Recommend minimum duration
-    logger.info(f"\n{Fore.CYAN}Recommendations:{Style.RESET_ALL}")
-    logger.info("  - Total audio: 10-30 minutes (minimum)")
-    logger.info("  - Format: WAV or MP3")
-    logger.info("  - Sample rate: 16-48 kHz")
-    logger.info("  - Quality: Clear, minimal background noise")
+    lines.append(f"\n{Fore.CYAN}Recommendations:{Style.RESET_ALL}")
+    lines.append("  - Total audio: 10-30 minutes (minimum)")
+    lines.append("  - Format: WAV or MP3")
+    lines.append("  - Sample rate: 16-48 kHz")
+    lines.append("  - Quality: Clear, minimal background noise")
+    
+    logger.info("\n".join(lines))
     
     return audio_files
 
@@ -105,8 +186,11 @@ def setup_training_environment():
                 "use_nsf": True,
             }
         }
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        if HAS_ORJSON:
+            config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(config, f, indent=2)
         logger.info(f"  ✓ Created {config_path}")
     
     return config_path
@@ -168,16 +252,28 @@ def show_alternative_methods():
 
 def main():
     """Main training setup."""
+    parser = argparse.ArgumentParser(description="Prepare your voice samples for training")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan samples/ instead of using the cached listing"
+    )
+    args = parser.parse_args()
+    
     print_header()
     
     # Check samples
-    audio_files = check_samples()
+    audio_files = check_samples(use_cache=not args.no_cache)
     if not audio_files:
         return
     
     # Setup environment
     setup_training_environment()
     
+    # Creating samples/44k on the first run bumps samples/'s mtime; refresh
+    # the index now so the next run doesn't miss it
+    scan_samples(Path("samples"))
+    
     # Show alternatives
     train_with_webui()
     show_alternative_methods()